@@ -29,9 +29,8 @@ def bump_cache() -> None:
 
         rj = r.json()
 
-    with LOCAL_CACHE.open("w", encoding="utf8") as f:
-        json.dump(rj, f, indent=2, ensure_ascii=False)
-        f.write("\n")  # Add in trailing newline
+    # Serialize up front so the cache is written in one go, including the trailing newline
+    LOCAL_CACHE.write_text(f"{json.dumps(rj, indent=2, ensure_ascii=False)}\n", encoding="utf8")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import datetime as dt
 import json
+import re
 import sys
-import tomllib
 import typing as t
 from collections import abc
 from dataclasses import dataclass
@@ -12,10 +13,23 @@ from enum import StrEnum
 from operator import attrgetter
 from pathlib import Path
 
-from packaging import specifiers, version
+from packaging import version
+
+if t.TYPE_CHECKING:
+    from packaging import specifiers
 
 CACHED_RELEASE_CYCLE = Path(__file__).parent / "cached_release_cycle.json"
 
+# Fast path for the common single-line `requires-python = "..."` declaration inside the `[project]`
+# table; anything more exotic falls through to a full TOML parse
+REQUIRES_PYTHON_RE = re.compile(
+    rb"^\[project\][ \t]*(?:#[^\r\n]*)?\r?$[^\[]*?"
+    rb'^requires-python[ \t]*=[ \t]*"([^"\\\r\n]+)"[ \t]*(?:#[^\r\n]*)?\r?$',
+    re.MULTILINE,
+)
+
+EOL_DATE_RE = re.compile(r"(\d{4})-(\d{2})(?:-(\d{2}))?")
+
 
 class EOLPythonError(Exception): ...  # noqa: D101
 
@@ -45,20 +59,15 @@ def _parse_eol_date(date_str: str) -> dt.date:
         * `YYYY-MM-DD` - Parsed as-is, assuming ISO 8601 format
         * `YYYY-MM` - Parsed as a `dt.date` instance for the 1st of the specified year & month
     """
-    parts = date_str.split("-")
-    match len(parts):
-        case 3:
-            eol_date = dt.date.fromisoformat(date_str)
-        case 2:
-            year, month = (int(c) for c in parts)
-            eol_date = dt.date(year=year, month=month, day=1)
-        case _:
-            raise ValueError(f"Unknown date format: '{date_str}'")
+    date_match = EOL_DATE_RE.fullmatch(date_str)
+    if not date_match:
+        raise ValueError(f"Unknown date format: '{date_str}'")
 
-    return eol_date
+    year, month, day = date_match.groups()
+    return dt.date(year=int(year), month=int(month), day=int(day) if day else 1)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonRelease:  # noqa: D101
     python_ver: version.Version
     status: ReleasePhase
@@ -81,44 +90,97 @@ class PythonRelease:  # noqa: D101
             end_of_life=_parse_eol_date(metadata["end_of_life"]),
         )
 
-    def is_eol(self, use_system_date: bool) -> bool:
+    def is_eol(self, use_system_date: bool, utc_today: dt.date | None = None) -> bool:
         """
         Check if this version is end-of-life.
 
         If `use_system_date` is `True`, an additional date-based check is performed for versions
-        that are not explicitly EOL.
+        that are not explicitly EOL. `utc_today` may be provided to avoid querying the system date
+        for each version when checking many versions at once.
         """
         if self.status == ReleasePhase.EOL:
             return True
 
         if use_system_date:
-            utc_today = dt.datetime.now(dt.timezone.utc).date()
+            if utc_today is None:
+                utc_today = dt.datetime.now(dt.timezone.utc).date()
+
             if self.end_of_life <= utc_today:
                 return True
 
         return False
 
 
-def _get_cached_release_cycle(cache_json: Path) -> list[PythonRelease]:
+_RELEASE_CYCLE_CACHE: dict[tuple[str, float], tuple[PythonRelease, ...]] = {}
+
+
+def _get_cached_release_cycle(cache_json: Path) -> tuple[PythonRelease, ...]:
     """
     Parse the locally cached Python release cycle into `PythonRelease` instance(s).
 
-    Results are sorted by Python version in descending order.
+    Results are sorted by Python version in ascending order, and are memoized by the cache
+    file's path & modification time.
     """
-    with cache_json.open("r", encoding="utf-8") as f:
-        contents = json.load(f)
-
-    # The sorting is probably unnecessary since the JSON should already be sorted, but going to
-    # retain since it's expected downstream
-    return sorted(
-        (PythonRelease.from_json(v, m) for v, m in contents.items()),
-        key=attrgetter("python_ver"),
-        reverse=True,
+    cache_key = (str(cache_json), cache_json.stat().st_mtime)
+    if cache_key in _RELEASE_CYCLE_CACHE:
+        return _RELEASE_CYCLE_CACHE[cache_key]
+
+    contents = json.loads(cache_json.read_bytes())
+
+    # The upstream JSON is sorted in descending order, but callers rely on ascending order (e.g. to
+    # bisect to the specifier floor in check_python_support)
+    release_cycle = tuple(
+        sorted(
+            (PythonRelease.from_json(v, m) for v, m in contents.items()),
+            key=attrgetter("python_ver"),
+        )
     )
+    _RELEASE_CYCLE_CACHE[cache_key] = release_cycle
+
+    return release_cycle
+
+
+def _get_requires_python(toml_file: Path) -> str | None:
+    """
+    Extract the `requires-python` specification from the input TOML's `[project]` table.
+
+    A regex scan is attempted first to avoid a full TOML parse for the common case. The regex can't
+    tell table headers & keys apart from the contents of multi-line strings, nor can it detect
+    duplicate keys, so its result is only trusted if the file contains no multi-line strings and a
+    single `requires-python` declaration; otherwise the file is parsed with `tomllib`.
+    """
+    raw = toml_file.read_bytes()
+    if b'"""' not in raw and b"'''" not in raw and raw.count(b"requires-python") == 1:
+        match = REQUIRES_PYTHON_RE.search(raw)
+        if match:
+            return match.group(1).decode("utf-8")
+
+    import tomllib  # Deferred since the fast path above covers most files
+
+    contents = tomllib.loads(raw.decode("utf-8"))
+    requires_python: str | None = contents.get("project", {}).get("requires-python", None)
+    return requires_python
+
+
+def _get_spec_floor(package_spec: specifiers.SpecifierSet) -> version.Version | None:
+    """
+    Determine the lower bound of the provided specifier set, if one is present.
+
+    Only `>=` and `>` specifiers are considered; if neither are present, `None` is returned. No
+    version lower than the returned floor can be contained by the specifier set.
+    """
+    floors = [version.Version(s.version) for s in package_spec if s.operator in {">=", ">"}]
+    if not floors:
+        return None
+
+    return max(floors)
 
 
 def check_python_support(
-    toml_file: Path, cache_json: Path = CACHED_RELEASE_CYCLE, use_system_date: bool = True
+    toml_file: Path,
+    cache_json: Path = CACHED_RELEASE_CYCLE,
+    use_system_date: bool = True,
+    release_cycle: tuple[PythonRelease, ...] | None = None,
 ) -> None:
     """
     Check the input TOML's `requires-python` for overlap with EOL Python version(s).
@@ -128,23 +190,36 @@ def check_python_support(
 
     If `use_system_date` is `True`, an additional date-based check is performed for versions that
     are not explicitly EOL.
-    """
-    with toml_file.open("rb") as f:
-        contents = tomllib.load(f)
 
-    requires_python = contents.get("project", {}).get("requires-python", None)
+    A pre-loaded `release_cycle`, sorted by Python version in ascending order, may be provided when
+    checking multiple files; if not provided, the release cycle is loaded from `cache_json`.
+    """
+    requires_python = _get_requires_python(toml_file)
     if not requires_python:
         raise RequiresPythonNotFoundError
 
+    # Deferred since the specifier machinery is comparatively expensive to import & isn't needed
+    # if we bail out above
+    from packaging import specifiers
+
     package_spec = specifiers.SpecifierSet(requires_python)
-    release_cycle = _get_cached_release_cycle(cache_json)
+    if release_cycle is None:
+        release_cycle = _get_cached_release_cycle(cache_json)
+
+    # Release cycle is sorted ascending, so we can skip straight past any versions below the floor
+    spec_floor = _get_spec_floor(package_spec)
+    start_idx = 0
+    if spec_floor is not None:
+        start_idx = bisect.bisect_left(release_cycle, spec_floor, key=attrgetter("python_ver"))
 
+    utc_today = dt.datetime.now(dt.timezone.utc).date()
     eol_supported = [
-        r for r in release_cycle if ((r.python_ver in package_spec) and r.is_eol(use_system_date))
+        r
+        for r in release_cycle[start_idx:]
+        if ((r.python_ver in package_spec) and r.is_eol(use_system_date, utc_today))
     ]
 
     if eol_supported:
-        eol_supported.sort(key=attrgetter("python_ver"))  # Sort ascending for error msg generation
         joined_vers = ", ".join(str(r.python_ver) for r in eol_supported)
         raise EOLPythonError(f"EOL Python support found: {joined_vers}")
 
@@ -155,10 +230,14 @@ def main(argv: abc.Sequence[str] | None = None) -> int:  # noqa: D103
     parser.add_argument("--cache_only", action="store_true")
     args = parser.parse_args(argv)
 
+    release_cycle = _get_cached_release_cycle(CACHED_RELEASE_CYCLE)
+
     ec = 0
     for file in args.filenames:
         try:
-            check_python_support(file, use_system_date=(not args.cache_only))
+            check_python_support(
+                file, use_system_date=(not args.cache_only), release_cycle=release_cycle
+            )
         except EOLPythonError as e:
             print(f"{file}: {e}")
             ec = 1
@@ -1,9 +1,11 @@
 import datetime as dt
+import os
+import tomllib
 from pathlib import Path
 
 import pytest
 import time_machine
-from packaging import version
+from packaging import specifiers, version
 
 from pre_commit_python_eol.check_eol import (
     EOLPythonError,
@@ -11,6 +13,8 @@ from pre_commit_python_eol.check_eol import (
     ReleasePhase,
     RequiresPythonNotFoundError,
     _get_cached_release_cycle,
+    _get_requires_python,
+    _get_spec_floor,
     _parse_eol_date,
     check_python_support,
 )
@@ -26,9 +30,13 @@ def test_parse_eol_date(date_str: str, truth_date: dt.date) -> None:
     assert _parse_eol_date(date_str) == truth_date
 
 
-def test_parse_eol_date_unknown_fmt_raises() -> None:
+EOL_DATE_UNKNOWN_FMT_CASES = ("123456", "2025", "2025-1", "2025-01-01-01", "2025-01-01T00:00")
+
+
+@pytest.mark.parametrize("date_str", EOL_DATE_UNKNOWN_FMT_CASES)
+def test_parse_eol_date_unknown_fmt_raises(date_str: str) -> None:
     with pytest.raises(ValueError, match="Unknown date format"):
-        _ = _parse_eol_date("123456")
+        _ = _parse_eol_date(date_str)
 
 
 def test_python_release_from_json() -> None:
@@ -50,17 +58,31 @@ def test_python_release_from_json() -> None:
     assert PythonRelease.from_json("3.14", metadata=sample_metadata) == truth_rel
 
 
+IS_EOL_CASES = (
+    (ReleasePhase.EOL, dt.date(year=2030, month=10, day=1), False, True),
+    (ReleasePhase.BUGFIX, dt.date(year=2030, month=10, day=1), False, False),
+    (ReleasePhase.BUGFIX, dt.date(year=2030, month=10, day=1), True, False),
+    (ReleasePhase.BUGFIX, dt.date(year=2025, month=1, day=1), False, False),
+    (ReleasePhase.BUGFIX, dt.date(year=2025, month=1, day=1), True, True),
+)
+
+
+@pytest.mark.parametrize(("status", "end_of_life", "use_system_date", "truth_eol"), IS_EOL_CASES)
+def test_python_release_is_eol(
+    status: ReleasePhase, end_of_life: dt.date, use_system_date: bool, truth_eol: bool
+) -> None:
+    rel = PythonRelease(python_ver=version.Version("3.14"), status=status, end_of_life=end_of_life)
+
+    with time_machine.travel(dt.date(year=2025, month=5, day=1)):
+        assert rel.is_eol(use_system_date) == truth_eol
+
+    # Explicitly provided date should take precedence over the system date
+    assert rel.is_eol(use_system_date, utc_today=dt.date(year=2025, month=5, day=1)) == truth_eol
+
+
 #  Intentionally out of expected order so sorting can be checked
 SAMPLE_JSON = """\
 {
-  "3.14": {
-    "branch": "3.14",
-    "pep": 745,
-    "status": "prerelease",
-    "first_release": "2025-10-07",
-    "end_of_life": "2030-10",
-    "release_manager": "Hugo van Kemenade"
-  },
   "3.15": {
     "branch": "main",
     "pep": 790,
@@ -68,22 +90,30 @@ SAMPLE_JSON = """\
     "first_release": "2026-10-01",
     "end_of_life": "2031-10",
     "release_manager": "Hugo van Kemenade"
+  },
+  "3.14": {
+    "branch": "3.14",
+    "pep": 745,
+    "status": "prerelease",
+    "first_release": "2025-10-07",
+    "end_of_life": "2030-10",
+    "release_manager": "Hugo van Kemenade"
   }
 }
 """
 
-TRUTH_RELEASE_CYCLE = [
-    PythonRelease(
-        python_ver=version.Version("3.15"),
-        status=ReleasePhase.FEATURE,
-        end_of_life=dt.date(year=2031, month=10, day=1),
-    ),
+TRUTH_RELEASE_CYCLE = (
     PythonRelease(
         python_ver=version.Version("3.14"),
         status=ReleasePhase.PRERELEASE,
         end_of_life=dt.date(year=2030, month=10, day=1),
     ),
-]
+    PythonRelease(
+        python_ver=version.Version("3.15"),
+        status=ReleasePhase.FEATURE,
+        end_of_life=dt.date(year=2031, month=10, day=1),
+    ),
+)
 
 
 def test_get_cached_release_cycle(tmp_path: Path) -> None:
@@ -94,6 +124,19 @@ def test_get_cached_release_cycle(tmp_path: Path) -> None:
     assert release_cycle == TRUTH_RELEASE_CYCLE
 
 
+def test_get_cached_release_cycle_memoized(tmp_path: Path) -> None:
+    json_file = tmp_path / "cache.json"
+    json_file.write_text(SAMPLE_JSON)
+
+    release_cycle = _get_cached_release_cycle(cache_json=json_file)
+    assert _get_cached_release_cycle(cache_json=json_file) is release_cycle
+
+    # Modifying the cache file should invalidate the memoized result
+    json_file.write_text(RELEASE_CACHE_WITH_EOL)
+    os.utime(json_file, ns=(0, 0))
+    assert _get_cached_release_cycle(cache_json=json_file) is not release_cycle
+
+
 RELEASE_CACHE_WITH_EOL = """\
 {
   "3.14": {
@@ -146,6 +189,80 @@ def test_check_python_no_version_spec_raises(path_with_cache: tuple[Path, Path])
         check_python_support(pyproject, cache_json=cache_path)
 
 
+def test_check_python_no_version_spec_skips_cache(tmp_path: Path) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(SAMPLE_PYPROJECT_NO_VERSION)
+
+    # Cache shouldn't be touched if there's no version spec to check against
+    with pytest.raises(RequiresPythonNotFoundError):
+        check_python_support(pyproject, cache_json=tmp_path / "missing_cache.json")
+
+
+REQUIRES_PYTHON_CASES = (
+    ('[project]\nrequires-python = ">=3.11"\n', ">=3.11"),
+    ('[project]\r\nrequires-python = ">=3.11"\r\n', ">=3.11"),
+    ('[project]  # Comment\nname = "foo"\nrequires-python = ">=3.11"  # Comment\n', ">=3.11"),
+    # Regex misses, should fall back to a full parse
+    ('[project]\nclassifiers = ["a", "b"]\nrequires-python = ">=3.11"\n', ">=3.11"),
+    ("[project]\nrequires-python = '>=3.11'\n", ">=3.11"),
+    ('[project]\n"requires-python" = ">=3.11"\n', ">=3.11"),
+    ('project.requires-python = ">=3.11"\n', ">=3.11"),
+    ('[tool.foo]\nrequires-python = ">=3.8"\n\n[project]\nrequires-python = ">=3.11"\n', ">=3.11"),
+    ('[project]\nname = "foo"\n\n[tool.foo]\nrequires-python = ">=3.8"\n', None),
+    ('[project]\nrequires-python = ""\n', ""),
+    # Multi-line strings may contain lookalike declarations, should fall back to a full parse
+    (
+        '[project]\ndescription = """\nrequires-python = ">=3.6"\n"""\n'
+        'requires-python = ">=3.11"\n',
+        ">=3.11",
+    ),
+    (
+        "[project]\ndescription = '''\nrequires-python = \">=3.6\"\n'''\n"
+        'requires-python = ">=3.11"\n',
+        ">=3.11",
+    ),
+    ('[tool.foo]\nexample = """\n[project]\nrequires-python = ">=3.6"\n"""\n', None),
+)
+
+REQUIRES_PYTHON_INVALID_TOML_CASES = (
+    '[project]\nrequires-python = ">=3.11"\nrequires-python = ">=3.6"\n',
+    '[project]\nrequires-python = ">=3.11" extra\n',
+)
+
+
+@pytest.mark.parametrize(("toml_str", "truth_spec"), REQUIRES_PYTHON_CASES)
+def test_get_requires_python(tmp_path: Path, toml_str: str, truth_spec: str | None) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_bytes(toml_str.encode("utf-8"))
+
+    assert _get_requires_python(pyproject) == truth_spec
+
+
+@pytest.mark.parametrize("toml_str", REQUIRES_PYTHON_INVALID_TOML_CASES)
+def test_get_requires_python_invalid_toml_raises(tmp_path: Path, toml_str: str) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_bytes(toml_str.encode("utf-8"))
+
+    with pytest.raises(tomllib.TOMLDecodeError):
+        _get_requires_python(pyproject)
+
+
+SPEC_FLOOR_CASES = (
+    (">=3.11", version.Version("3.11")),
+    (">3.11", version.Version("3.11")),
+    (">=3.11,<4", version.Version("3.11")),
+    (">=3.8,>=3.11", version.Version("3.11")),
+    ("<4", None),
+    ("==3.11.*", None),
+    ("~=3.11", None),
+)
+
+
+@pytest.mark.parametrize(("spec_str", "truth_floor"), SPEC_FLOOR_CASES)
+def test_get_spec_floor(spec_str: str, truth_floor: version.Version | None) -> None:
+    assert _get_spec_floor(specifiers.SpecifierSet(spec_str)) == truth_floor
+
+
 SAMPLE_PYPROJECT_NO_EOL = """\
 [project]
 requires-python = ">=3.11"
@@ -230,6 +347,26 @@ def test_check_cached_python_support_single_eol_no_raises_by_date(
         )
 
 
+def test_check_python_support_preloaded_release_cycle(
+    path_with_cache: tuple[Path, Path],
+) -> None:
+    base_path, cache_path = path_with_cache
+    pyproject = base_path / "pyproject.toml"
+    pyproject.write_text(SAMPLE_PYPROJECT_SINGLE_EOL)
+
+    # Preloaded release cycle should take precedence over the cache file
+    release_cycle = _get_cached_release_cycle(cache_path)
+    with pytest.raises(EOLPythonError) as e:
+        check_python_support(
+            pyproject,
+            cache_json=base_path / "missing_cache.json",
+            use_system_date=False,
+            release_cycle=release_cycle,
+        )
+
+    assert str(e.value).endswith("3.8")
+
+
 def test_check_cached_python_support_no_eol(path_with_cache: tuple[Path, Path]) -> None:
     base_path, cache_path = path_with_cache
     pyproject = base_path / "pyproject.toml"
@@ -255,3 +392,20 @@ def test_check_cached_python_support_single_eol_raises(path_with_cache: tuple[Pa
         )
 
     assert str(e.value).endswith("3.8")
+
+
+SAMPLE_PYPROJECT_NO_FLOOR = """\
+[project]
+requires-python = "<3.9"
+"""
+
+
+def test_check_python_support_no_spec_floor_raises(path_with_cache: tuple[Path, Path]) -> None:
+    base_path, cache_path = path_with_cache
+    pyproject = base_path / "pyproject.toml"
+    pyproject.write_text(SAMPLE_PYPROJECT_NO_FLOOR)
+
+    with pytest.raises(EOLPythonError) as e:
+        check_python_support(pyproject, cache_json=cache_path, use_system_date=False)
+
+    assert str(e.value).endswith("3.7, 3.8")